@@ -2,34 +2,75 @@
 
 Factory functions to create configured agent instances.
 """
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, List, Mapping, Tuple
 import yaml
 
-from claude_agent_sdk.archetypes import ResearchAgent, ContentCreatorAgent, ReportingAgent
-from claude_agent_sdk.integrations.yarnnn import YarnnnMemory, YarnnnGovernance
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
 
+from api.settings import get_settings
 
-def load_agent_config(agent_type: str) -> dict:
+if TYPE_CHECKING:
+    # SDK modules are imported inside the factories to keep startup light
+    from claude_agent_sdk.archetypes import ResearchAgent, ContentCreatorAgent, ReportingAgent
+    from claude_agent_sdk.integrations.yarnnn import YarnnnMemory, YarnnnGovernance
+
+# Environment variables the service needs to run agents
+REQUIRED_ENV_VARS = ("ANTHROPIC_API_KEY", "YARNNN_API_KEY", "YARNNN_API_URL")
+
+# Directory holding per-agent config.yaml files
+_AGENTS_DIR = Path(__file__).resolve().parent.parent / "agents"
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def load_agent_config(agent_type: str) -> Mapping[str, Any]:
     """Load agent configuration from YAML file.
 
+    Configs are immutable for the life of the process: each agent type is
+    loaded once and returned as a deeply read-only mapping (nested mappings
+    are read-only and lists become tuples). Call
+    ``load_agent_config.cache_clear()`` to pick up edits.
+
     Args:
         agent_type: Type of agent (research, content, reporting)
 
     Returns:
-        Configuration dictionary
+        Read-only configuration mapping
     """
-    config_path = Path(__file__).parent.parent / "agents" / agent_type / "config.yaml"
+    config_path = _AGENTS_DIR / agent_type / "config.yaml"
+
+    try:
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config not found: {config_path}") from None
+
+    return _freeze(config)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config not found: {config_path}")
 
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+def get_missing_env_vars() -> List[str]:
+    """Return required environment variables that were not set at startup."""
+    settings = get_settings()
+    return [name for name in REQUIRED_ENV_VARS if not getattr(settings, name.lower())]
 
 
-def get_yarnnn_providers(workspace_id: str, basket_id: str):
+def get_yarnnn_providers(
+    workspace_id: str, basket_id: str
+) -> Tuple["YarnnnMemory", "YarnnnGovernance"]:
     """Create Yarnnn memory and governance providers.
 
     Args:
@@ -39,9 +80,10 @@ def get_yarnnn_providers(workspace_id: str, basket_id: str):
     Returns:
         Tuple of (YarnnnMemory, YarnnnGovernance)
     """
-    # Get credentials from environment
-    api_key = os.getenv("YARNNN_API_KEY")
-    api_url = os.getenv("YARNNN_API_URL")
+    # Get credentials from settings
+    settings = get_settings()
+    api_key = settings.yarnnn_api_key
+    api_url = settings.yarnnn_api_url
 
     if not all([api_key, api_url]):
         raise ValueError(
@@ -49,6 +91,8 @@ def get_yarnnn_providers(workspace_id: str, basket_id: str):
             "YARNNN_API_KEY, YARNNN_API_URL"
         )
 
+    from claude_agent_sdk.integrations.yarnnn import YarnnnMemory, YarnnnGovernance
+
     memory = YarnnnMemory(
         basket_id=basket_id,
         api_key=api_key,
@@ -66,8 +110,11 @@ def get_yarnnn_providers(workspace_id: str, basket_id: str):
     return memory, governance
 
 
-def create_research_agent(workspace_id: str, basket_id: str) -> ResearchAgent:
-    """Create configured research agent instance.
+def create_research_agent(workspace_id: str, basket_id: str) -> "ResearchAgent":
+    """Get configured research agent instance.
+
+    Agents (and the providers they hold) are reused across requests for the
+    same workspace and basket.
 
     Args:
         workspace_id: Yarnnn workspace ID (from request)
@@ -76,13 +123,31 @@ def create_research_agent(workspace_id: str, basket_id: str) -> ResearchAgent:
     Returns:
         Configured ResearchAgent
     """
+    return _build_research_agent(workspace_id, basket_id)
+
+
+def clear_agent_cache() -> None:
+    """Drop cached agents so the next request builds them from current config.
+
+    Cached agents hold providers and an Anthropic client bound to the event
+    loop they were first used on, so clear them whenever the app starts or
+    stops.
+    """
+    _build_research_agent.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def _build_research_agent(workspace_id: str, basket_id: str) -> "ResearchAgent":
+    """Build a research agent for one (workspace_id, basket_id) pair."""
+    from claude_agent_sdk.archetypes import ResearchAgent
+
     config = load_agent_config("research")
 
     # Get Yarnnn providers with dynamic workspace and basket
     memory, governance = get_yarnnn_providers(workspace_id, basket_id)
 
     # Get Anthropic API key
-    anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
+    anthropic_api_key = get_settings().anthropic_api_key
     if not anthropic_api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable required")
 
@@ -92,14 +157,14 @@ def create_research_agent(workspace_id: str, basket_id: str) -> ResearchAgent:
         memory=memory,
         governance=governance,
         anthropic_api_key=anthropic_api_key,
-        monitoring_domains=config["research"]["monitoring_domains"],
+        monitoring_domains=list(config["research"]["monitoring_domains"]),
         monitoring_frequency=config["research"]["monitoring_frequency"],
         signal_threshold=config["research"]["signal_threshold"],
         synthesis_mode=config["research"]["synthesis_mode"]
     )
 
 
-def create_content_agent() -> ContentCreatorAgent:
+def create_content_agent() -> "ContentCreatorAgent":
     """Create configured content creator agent instance.
 
     Returns:
@@ -112,7 +177,7 @@ def create_content_agent() -> ContentCreatorAgent:
     raise NotImplementedError("Content agent not yet configured")
 
 
-def create_reporting_agent() -> ReportingAgent:
+def create_reporting_agent() -> "ReportingAgent":
     """Create configured reporting agent instance.
 
     Returns:
@@ -2,19 +2,24 @@
 
 This service exposes HTTP endpoints that Yarnnn main service calls to trigger agents.
 """
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
+from api.dependencies import clear_agent_cache, get_missing_env_vars, load_agent_config
+from api.responses import ORJSONResponse
 from api.routes import research, content, reporting
+from api.settings import get_settings
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=get_settings().log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
@@ -24,8 +29,32 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Application lifespan handler."""
     logger.info("Starting Yarnnn Agent Deployment Service")
+
+    missing_vars = get_missing_env_vars()
+    if missing_vars:
+        logger.warning("Missing environment variables: %s", ", ".join(missing_vars))
+
+    # Size the worker threads used for blocking calls: run_in_threadpool uses
+    # anyio's limiter, asyncio.to_thread (used by SDK providers) the loop's
+    # default executor.
+    thread_pool_size = get_settings().thread_pool_size
+    if thread_pool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = thread_pool_size
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=thread_pool_size)
+        )
+
+    # (Re)load configs so the first request doesn't pay for YAML parsing, and
+    # drop agents built from the old ones
+    load_agent_config.cache_clear()
+    clear_agent_cache()
+    for agent_type in ("research", "content", "reporting"):
+        load_agent_config(agent_type)
+
     yield
     logger.info("Shutting down Yarnnn Agent Deployment Service")
+    await research.cancel_running_tasks()
+    clear_agent_cache()
 
 
 # Create FastAPI app
@@ -36,13 +65,15 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# CORS middleware (configure as needed)
+# CORS middleware. The Yarnnn main service calls us server-to-server, so only
+# browser origins listed in ALLOWED_ORIGINS (comma-separated) are allowed.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # TODO: Configure for production
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=get_settings().cors_origins,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=600,
 )
 
 # Include routers
@@ -73,8 +104,8 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -85,4 +116,13 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # The default "auto" loop picks uvloop where it is installed and supported
+    # (not on Windows). Research task results are tracked in-process, so this
+    # runs a single worker.
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        http="httptools",
+    )
@@ -0,0 +1,42 @@
+"""Response classes shared across API routes."""
+import hashlib
+from typing import Any, Dict
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def cacheable_response(request: Request, payload: Dict[str, Any], max_age: int = 30) -> Response:
+    """Build a JSON response with ETag and Cache-Control headers.
+
+    Returns 304 Not Modified when the client's If-None-Match matches, so
+    polling clients can revalidate without downloading the body again.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        payload: JSON-serializable response body
+        max_age: Seconds clients may reuse the response without revalidating
+
+    Returns:
+        200 response with the payload, or an empty 304 response
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate=60",
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
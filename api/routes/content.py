@@ -1,9 +1,11 @@
 """Content creator agent API endpoints."""
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from api.responses import cacheable_response
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -46,13 +48,13 @@ async def run_content_task(request: ContentTaskRequest):
 
 
 @router.get("/status")
-async def get_content_agent_status():
+async def get_content_agent_status(request: Request):
     """Get content agent status.
 
     Returns:
         Agent status information
     """
-    return {
+    return cacheable_response(request, {
         "status": "not_configured",
         "message": "Content agent not yet configured. Coming soon after ResearchAgent validation."
-    }
+    })
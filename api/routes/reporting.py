@@ -1,9 +1,11 @@
 """Reporting agent API endpoints."""
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from api.responses import cacheable_response
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -45,13 +47,13 @@ async def run_reporting_task(request: ReportingTaskRequest):
 
 
 @router.get("/status")
-async def get_reporting_agent_status():
+async def get_reporting_agent_status(request: Request):
     """Get reporting agent status.
 
     Returns:
         Agent status information
     """
-    return {
+    return cacheable_response(request, {
         "status": "not_configured",
         "message": "Reporting agent not yet configured. Coming soon after ResearchAgent validation."
-    }
+    })
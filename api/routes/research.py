@@ -1,25 +1,66 @@
 """Research agent API endpoints."""
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from api.dependencies import create_research_agent
+from api.dependencies import create_research_agent, get_missing_env_vars, load_agent_config
+from api.responses import cacheable_response
+from api.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upper bound on tasks kept for result lookups; oldest finished tasks are dropped
+_MAX_TRACKED_TASKS = 1000
+
+# Research tasks keyed by task_id, in submission order
+_tasks: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+
+# Research tasks allowed to run at once; the rest wait for a slot. Keeps bursts
+# of /run calls from tripping Anthropic rate limits. Created on first use so it
+# binds to the running event loop and reflects current settings.
+_task_slots: Optional[asyncio.Semaphore] = None
+
+# monitoring_frequency -> UTC period a monitor run covers, as a strftime format.
+# A monitor result is reused only by requests made in the same period as the
+# run, so a scheduled run at the start of each period always runs.
+_FREQUENCY_PERIODS = {"hourly": "%Y-%m-%dT%H", "daily": "%Y-%m-%d", "weekly": "%G-W%V"}
+
+# Upper bound on completed results kept for reuse
+_MAX_RECENT_RESULTS = 256
+
+# (task_type, workspace_id, basket_id, topic) -> task_id of the run in progress
+_inflight: Dict[Tuple, str] = {}
+
+# (task_type, workspace_id, basket_id, topic) -> (started_at, task_id, result)
+_recent_results: "OrderedDict[Tuple, Tuple[float, str, Any]]" = OrderedDict()
+
 
 class ResearchTaskRequest(BaseModel):
     """Request model for research tasks."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     task_type: str = Field(..., description="Type of research task (monitor, deep_dive)")
     topic: Optional[str] = Field(None, description="Topic for deep dive research")
     workspace_id: str = Field(..., description="Yarnnn workspace ID for this request")
     basket_id: str = Field(..., description="Yarnnn basket ID to store research results")
     parameters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional parameters")
 
+    @model_validator(mode="after")
+    def _require_topic_for_deep_dive(self) -> "ResearchTaskRequest":
+        if self.task_type == "deep_dive" and not self.topic:
+            raise ValueError("Topic required for deep_dive tasks")
+        return self
+
 
 class ResearchTaskResponse(BaseModel):
     """Response model for research tasks."""
@@ -29,11 +70,144 @@ class ResearchTaskResponse(BaseModel):
     result: Optional[Dict[str, Any]] = None
 
 
-@router.post("/run", response_model=ResearchTaskResponse)
-async def run_research_task(request: ResearchTaskRequest):
+# task_type -> (agent coroutine factory, accepted message template)
+_TASK_DISPATCH: Dict[str, Tuple[Callable[[Any, ResearchTaskRequest], Coroutine], str]] = {
+    "monitor": (
+        lambda agent, request: agent.monitor(),
+        "Monitoring started",
+    ),
+    "deep_dive": (
+        lambda agent, request: agent.deep_dive(request.topic),
+        "Deep dive started for topic: {topic}",
+    ),
+}
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Log research tasks that finished with an exception."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Research task failed: %s", task.exception(), exc_info=task.exception())
+
+
+def _period(fmt: str, timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(fmt)
+
+
+def _is_fresh(task_type: str, started_at: float, now: float) -> bool:
+    """Whether the result of a run started at ``started_at`` may be reused at ``now``."""
+    if task_type == "deep_dive":
+        return now - started_at < get_settings().deep_dive_result_ttl
+    if task_type == "monitor":
+        frequency = load_agent_config("research").get("research", {}).get("monitoring_frequency")
+        fmt = _FREQUENCY_PERIODS.get(frequency)
+        return fmt is not None and _period(fmt, started_at) == _period(fmt, now)
+    return False
+
+
+def _get_recent_result(key: Tuple) -> Optional[Tuple[str, Any]]:
+    """Return (task_id, result) of a completed run that is still fresh."""
+    entry = _recent_results.get(key)
+    if entry is None:
+        return None
+
+    started_at, task_id, result = entry
+    if not _is_fresh(key[0], started_at, time.time()):
+        del _recent_results[key]
+        return None
+    return task_id, result
+
+
+def _remember_result(key: Tuple, task_id: str, started_at: float, task: asyncio.Task) -> None:
+    """Keep the result of a successful task for reuse by identical requests."""
+    if _inflight.get(key) == task_id:
+        del _inflight[key]
+
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    _recent_results[key] = (started_at, task_id, task.result())
+    _recent_results.move_to_end(key)
+    while len(_recent_results) > _MAX_RECENT_RESULTS:
+        _recent_results.popitem(last=False)
+
+
+def _get_task_slots() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrently running research tasks."""
+    global _task_slots
+    if _task_slots is None:
+        _task_slots = asyncio.Semaphore(get_settings().max_concurrent_research_tasks)
+    return _task_slots
+
+
+async def _run_bounded(coro: Coroutine) -> Any:
+    """Run a research coroutine once a concurrency slot is free.
+
+    Raises:
+        TimeoutError: The coroutine ran longer than ``RESEARCH_TASK_TIMEOUT``
+    """
+    timeout = get_settings().research_task_timeout
+    async with _get_task_slots():
+        try:
+            return await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Research task timed out after {timeout:g}s") from None
+
+
+def _start_task(coro: Coroutine, result_key: Optional[Tuple] = None) -> str:
+    """Schedule a research coroutine in the background and return its task ID.
+
+    If ``result_key`` is given, identical requests join the task while it
+    runs and a successful result is kept for reuse.
+    """
+    task_id = uuid.uuid4().hex
+    started_at = time.time()
+    task = asyncio.create_task(_run_bounded(coro))
+    task.add_done_callback(_log_task_failure)
+    if result_key is not None:
+        _inflight[result_key] = task_id
+        task.add_done_callback(lambda t: _remember_result(result_key, task_id, started_at, t))
+    _tasks[task_id] = task
+
+    # Drop the oldest finished tasks, skipping over any still running
+    while len(_tasks) > _MAX_TRACKED_TASKS:
+        finished_id = next((tid for tid, t in _tasks.items() if t.done()), None)
+        if finished_id is None:
+            break
+        del _tasks[finished_id]
+
+    return task_id
+
+
+async def cancel_running_tasks() -> None:
+    """Cancel research tasks that are still running and wait for them to finish.
+
+    Called on application shutdown.
+    """
+    global _task_slots
+
+    running = [task for task in _tasks.values() if not task.done()]
+    for task in running:
+        task.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+
+    _inflight.clear()
+    _task_slots = None
+
+
+@router.post("/run", response_model=ResearchTaskResponse, status_code=202)
+async def run_research_task(request: ResearchTaskRequest, response: Response):
     """Trigger research agent task.
 
     This endpoint is called by Yarnnn main service to trigger research tasks.
+    Tasks run in the background; poll ``/result/{task_id}`` for the outcome.
+
+    A completed monitor run requested in the current ``monitoring_frequency``
+    period (UTC hour, day or ISO week), or a deep_dive on the same topic
+    requested within ``DEEP_DIVE_RESULT_TTL`` seconds (off by default, since a
+    reused result makes no governance proposal), is returned directly
+    (200, status "completed") instead of starting a new one.
+    An identical request that arrives while a run is in progress gets that
+    run's task_id. Pass ``parameters: {"refresh": true}`` to force a new run.
 
     Supported task types:
     - monitor: Run monitoring across configured domains
@@ -43,83 +217,121 @@ async def run_research_task(request: ResearchTaskRequest):
         request: Research task request
 
     Returns:
-        Task execution result
+        Accepted task with its task_id
     """
-    logger.info(f"Received research task: {request.task_type} for workspace: {request.workspace_id}")
+    logger.info("Received research task: %s for workspace: %s", request.task_type, request.workspace_id)
 
-    try:
-        # Create agent instance with dynamic workspace and basket
-        agent = create_research_agent(
-            workspace_id=request.workspace_id,
-            basket_id=request.basket_id
+    dispatch = _TASK_DISPATCH.get(request.task_type)
+    if dispatch is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown task type: {request.task_type}. "
+                   f"Supported: {', '.join(_TASK_DISPATCH)}"
         )
+    start_coro, message = dispatch
 
-        # Execute based on task type
-        if request.task_type == "monitor":
-            logger.info("Running research monitoring")
-            result = await agent.monitor()
-
+    result_key = (request.task_type, request.workspace_id, request.basket_id, request.topic)
+    if not (request.parameters or {}).get("refresh"):
+        recent = _get_recent_result(result_key)
+        if recent is not None:
+            task_id, result = recent
+            response.status_code = 200
             return ResearchTaskResponse(
                 status="completed",
-                message="Monitoring completed successfully",
+                task_id=task_id,
+                message="Reusing result from a recent run",
                 result=result
             )
 
-        elif request.task_type == "deep_dive":
-            if not request.topic:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Topic required for deep_dive tasks"
-                )
-
-            logger.info(f"Running deep dive research on: {request.topic}")
-            result = await agent.deep_dive(request.topic)
-
+        task_id = _inflight.get(result_key)
+        if task_id is not None:
             return ResearchTaskResponse(
-                status="completed",
-                message=f"Deep dive completed for topic: {request.topic}",
-                result=result
+                status="accepted",
+                task_id=task_id,
+                message=message.format(topic=request.topic)
             )
 
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown task type: {request.task_type}. "
-                       f"Supported: monitor, deep_dive"
-            )
+    try:
+        # Get agent instance for this workspace and basket. Building one may
+        # read config from disk, so keep it off the event loop.
+        agent = await run_in_threadpool(
+            create_research_agent,
+            workspace_id=request.workspace_id,
+            basket_id=request.basket_id
+        )
+
+        task_id = _start_task(start_coro(agent, request), result_key)
 
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
     except Exception as e:
-        logger.error(f"Error executing research task: {e}", exc_info=True)
+        logger.error("Error starting research task: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Task execution failed: {str(e)}")
 
+    return ResearchTaskResponse(
+        status="accepted",
+        task_id=task_id,
+        message=message.format(topic=request.topic)
+    )
+
+
+@router.get("/result/{task_id}", response_model=ResearchTaskResponse)
+async def get_research_task_result(task_id: str):
+    """Get the status or result of a research task.
+
+    Args:
+        task_id: ID returned by ``/run``
+
+    Returns:
+        Task status, with the result once completed
+    """
+    task = _tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Unknown task: {task_id}")
+
+    if not task.done():
+        return ResearchTaskResponse(status="running", task_id=task_id, message="Task is running")
+
+    if task.cancelled():
+        return ResearchTaskResponse(status="failed", task_id=task_id, message="Task was cancelled")
+
+    if task.exception() is not None:
+        return ResearchTaskResponse(
+            status="failed",
+            task_id=task_id,
+            message=f"Task execution failed: {task.exception()}"
+        )
+
+    return ResearchTaskResponse(
+        status="completed",
+        task_id=task_id,
+        message="Task completed successfully",
+        result=task.result()
+    )
+
 
 @router.get("/status")
-async def get_research_agent_status():
+async def get_research_agent_status(request: Request):
     """Get research agent status and configuration.
 
     Returns:
         Agent status information
     """
-    import os
-
     # Check if required environment variables are set
-    required_vars = ["ANTHROPIC_API_KEY", "YARNNN_API_KEY", "YARNNN_API_URL"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = get_missing_env_vars()
 
     if missing_vars:
-        return {
+        return cacheable_response(request, {
             "status": "not_configured",
             "message": f"Missing environment variables: {', '.join(missing_vars)}",
             "note": "workspace_id and basket_id are now passed per-request"
-        }
+        })
 
-    return {
+    return cacheable_response(request, {
         "status": "ready",
         "agent_type": "research",
         "message": "Research agent endpoint is ready. Pass workspace_id and basket_id in requests.",
         "required_request_params": ["task_type", "workspace_id", "basket_id"]
-    }
+    })
@@ -0,0 +1,45 @@
+"""Service settings read from the environment.
+
+The environment is fixed for the lifetime of the process, so it is parsed
+and validated once into a frozen ``Settings`` object.
+"""
+from functools import lru_cache
+from typing import List, Literal, Optional
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Parsed service configuration."""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore", env_ignore_empty=True)
+
+    anthropic_api_key: Optional[str] = None
+    yarnnn_api_key: Optional[str] = None
+    yarnnn_api_url: Optional[str] = None
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    allowed_origins: str = Field("", description="Comma-separated browser origins allowed by CORS")
+    max_concurrent_research_tasks: int = Field(4, ge=1)
+    deep_dive_result_ttl: int = Field(0, ge=0)
+    research_task_timeout: float = Field(1800, gt=0)
+    thread_pool_size: Optional[int] = Field(None, ge=1)
+
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def _upper_log_level(cls, value: object) -> object:
+        return value.upper() if isinstance(value, str) else value
+
+    @property
+    def cors_origins(self) -> List[str]:
+        """Origins from ``allowed_origins``, split and stripped."""
+        return [origin.strip() for origin in self.allowed_origins.split(",") if origin.strip()]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return settings parsed from the environment.
+
+    Parsed on first call and cached; call ``get_settings.cache_clear()`` to
+    re-read the environment (e.g. in tests).
+    """
+    return Settings()
@@ -1,8 +1,17 @@
 """Integration tests for API endpoints."""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
 from api.main import app
+from api.routes import research
+from api.settings import get_settings
 
 client = TestClient(app)
 
@@ -79,3 +88,265 @@ def test_reporting_agent_not_implemented():
 #         json={"task_type": "monitor"}
 #     )
 #     assert response.status_code == 200
+
+
+def test_research_result_unknown_task():
+    """Test that polling an unknown research task returns 404."""
+    response = client.get("/agents/research/result/does-not-exist")
+    assert response.status_code == 404
+
+
+def test_research_run_rejects_unknown_fields():
+    """Test that research requests with unexpected fields are rejected."""
+    response = client.post(
+        "/agents/research/run",
+        json={
+            "task_type": "monitor",
+            "workspace_id": "ws_test",
+            "basket_id": "basket_test",
+            "unexpected": True
+        }
+    )
+    assert response.status_code == 422
+
+
+def test_research_unknown_task_type():
+    """Test that unknown research task types are rejected with 400."""
+    response = client.post(
+        "/agents/research/run",
+        json={"task_type": "unknown", "workspace_id": "ws_test", "basket_id": "basket_test"}
+    )
+    assert response.status_code == 400
+
+
+def test_research_deep_dive_requires_topic():
+    """Test that deep_dive without a topic fails validation."""
+    response = client.post(
+        "/agents/research/run",
+        json={"task_type": "deep_dive", "workspace_id": "ws_test", "basket_id": "basket_test"}
+    )
+    assert response.status_code == 422
+
+
+def test_status_endpoint_etag_revalidation():
+    """Test that status endpoints return 304 when the ETag matches."""
+    response = client.get("/agents/content/status")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = client.get("/agents/content/status", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+class StubResearchAgent:
+    """Stand-in for ResearchAgent whose tasks finish once released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def _run(self, result):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            while not self.release.is_set():
+                await asyncio.sleep(0.005)
+        finally:
+            self.running -= 1
+        return result
+
+    async def monitor(self):
+        return await self._run({"signals": []})
+
+    async def deep_dive(self, topic):
+        if topic == "fail":
+            raise RuntimeError("research backend unavailable")
+        if topic == "hang":
+            await asyncio.sleep(3600)
+        return await self._run({"topic": topic})
+
+
+MONITOR_REQUEST = {"task_type": "monitor", "workspace_id": "ws_test", "basket_id": "basket_test"}
+
+
+def deep_dive_request(topic):
+    return {**MONITOR_REQUEST, "task_type": "deep_dive", "topic": topic}
+
+
+@pytest.fixture
+def research_client(monkeypatch):
+    """Client with a running lifespan and a stub research agent."""
+    agent = StubResearchAgent()
+    monkeypatch.setattr(research, "create_research_agent", lambda workspace_id, basket_id: agent)
+    monkeypatch.setattr(research, "_tasks", OrderedDict())
+    monkeypatch.setattr(research, "_inflight", {})
+    monkeypatch.setattr(research, "_recent_results", OrderedDict())
+    get_settings.cache_clear()
+
+    with TestClient(app) as test_client:
+        yield test_client, agent
+    get_settings.cache_clear()
+
+
+def wait_for_status(test_client, task_id, status):
+    """Poll /result until the task reaches ``status``."""
+    for _ in range(200):
+        data = test_client.get(f"/agents/research/result/{task_id}").json()
+        if data["status"] == status:
+            return data
+        time.sleep(0.01)
+    raise AssertionError(f"Task {task_id} never reached {status!r}; last: {data}")
+
+
+def test_research_run_completes_in_background(research_client):
+    """Test that /run accepts the task and /result reports its progress."""
+    test_client, agent = research_client
+
+    response = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    assert response.status_code == 202
+    task_id = response.json()["task_id"]
+    assert wait_for_status(test_client, task_id, "running")["result"] is None
+
+    agent.release.set()
+    data = wait_for_status(test_client, task_id, "completed")
+    assert data["result"] == {"signals": []}
+
+
+def test_research_duplicate_request_joins_running_task(research_client):
+    """Test that an identical request while running gets the same task_id."""
+    test_client, agent = research_client
+
+    first = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    second = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    assert second.status_code == 202
+    assert second.json()["task_id"] == first.json()["task_id"]
+
+    agent.release.set()
+    wait_for_status(test_client, first.json()["task_id"], "completed")
+    assert agent.calls == 1
+
+
+def test_research_recent_result_reused_unless_refreshed(research_client):
+    """Test that a completed result is reused and refresh forces a new run."""
+    test_client, agent = research_client
+    agent.release.set()
+
+    task_id = test_client.post("/agents/research/run", json=MONITOR_REQUEST).json()["task_id"]
+    wait_for_status(test_client, task_id, "completed")
+
+    response = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.json()["task_id"] == task_id
+    assert response.json()["result"] == {"signals": []}
+
+    response = test_client.post(
+        "/agents/research/run",
+        json={**MONITOR_REQUEST, "parameters": {"refresh": True}}
+    )
+    assert response.status_code == 202
+    assert response.json()["task_id"] != task_id
+
+
+def test_research_failed_task_reports_failed(research_client):
+    """Test that a task raising an exception is reported as failed."""
+    test_client, _ = research_client
+
+    task_id = test_client.post("/agents/research/run", json=deep_dive_request("fail")).json()["task_id"]
+    data = wait_for_status(test_client, task_id, "failed")
+    assert "research backend unavailable" in data["message"]
+
+
+def test_research_task_timeout(research_client, monkeypatch):
+    """Test that tasks running past RESEARCH_TASK_TIMEOUT fail."""
+    test_client, _ = research_client
+    monkeypatch.setenv("RESEARCH_TASK_TIMEOUT", "0.05")
+    get_settings.cache_clear()
+
+    task_id = test_client.post("/agents/research/run", json=MONITOR_REQUEST).json()["task_id"]
+    data = wait_for_status(test_client, task_id, "failed")
+    assert "timed out" in data["message"]
+
+
+def test_research_tasks_respect_concurrency_limit(research_client, monkeypatch):
+    """Test that MAX_CONCURRENT_RESEARCH_TASKS bounds running tasks."""
+    test_client, agent = research_client
+    monkeypatch.setenv("MAX_CONCURRENT_RESEARCH_TASKS", "1")
+    get_settings.cache_clear()
+
+    task_ids = [
+        test_client.post("/agents/research/run", json=deep_dive_request(topic)).json()["task_id"]
+        for topic in ("agents", "markets")
+    ]
+    time.sleep(0.05)
+    assert agent.running == 1
+
+    agent.release.set()
+    for task_id in task_ids:
+        wait_for_status(test_client, task_id, "completed")
+    assert agent.max_running == 1
+
+
+def test_research_eviction_skips_running_tasks(research_client, monkeypatch):
+    """Test that finished tasks are evicted even behind a task still running."""
+    test_client, agent = research_client
+    monkeypatch.setattr(research, "_MAX_TRACKED_TASKS", 2)
+    agent.release.set()
+
+    hung_id = test_client.post("/agents/research/run", json=deep_dive_request("hang")).json()["task_id"]
+    finished_ids = []
+    for topic in ("agents", "markets"):
+        task_id = test_client.post("/agents/research/run", json=deep_dive_request(topic)).json()["task_id"]
+        wait_for_status(test_client, task_id, "completed")
+        finished_ids.append(task_id)
+    test_client.post("/agents/research/run", json=deep_dive_request("competitors"))
+
+    assert test_client.get(f"/agents/research/result/{finished_ids[0]}").status_code == 404
+    assert test_client.get(f"/agents/research/result/{finished_ids[1]}").status_code == 404
+    assert test_client.get(f"/agents/research/result/{hung_id}").json()["status"] == "running"
+
+
+def test_research_monitor_reuse_is_per_frequency_period(research_client, monkeypatch):
+    """Test that a daily monitor result is reused only within the same UTC day."""
+    test_client, agent = research_client
+    agent.release.set()
+    monkeypatch.setattr(
+        research, "load_agent_config",
+        lambda agent_type: {"research": {"monitoring_frequency": "daily"}}
+    )
+    now = [datetime(2026, 1, 1, 6, 0, tzinfo=timezone.utc).timestamp()]
+    monkeypatch.setattr(research, "time", SimpleNamespace(time=lambda: now[0]))
+
+    task_id = test_client.post("/agents/research/run", json=MONITOR_REQUEST).json()["task_id"]
+    wait_for_status(test_client, task_id, "completed")
+
+    # Later the same day: reused
+    now[0] = datetime(2026, 1, 1, 23, 0, tzinfo=timezone.utc).timestamp()
+    response = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    assert response.status_code == 200
+    assert response.json()["task_id"] == task_id
+
+    # Next day's scheduled run, less than 24h after the first finished: runs again
+    now[0] = datetime(2026, 1, 2, 6, 0, tzinfo=timezone.utc).timestamp()
+    response = test_client.post("/agents/research/run", json=MONITOR_REQUEST)
+    assert response.status_code == 202
+    assert response.json()["task_id"] != task_id
+
+
+def test_research_deep_dive_not_reused_by_default(research_client):
+    """Test that deep_dive results are not reused unless DEEP_DIVE_RESULT_TTL is set."""
+    test_client, agent = research_client
+    agent.release.set()
+
+    task_id = test_client.post("/agents/research/run", json=deep_dive_request("agents")).json()["task_id"]
+    wait_for_status(test_client, task_id, "completed")
+
+    response = test_client.post("/agents/research/run", json=deep_dive_request("agents"))
+    assert response.status_code == 202
+    assert response.json()["task_id"] != task_id
+    wait_for_status(test_client, response.json()["task_id"], "completed")
+    assert agent.calls == 2